@@ -1,32 +1,236 @@
 import streamlit as st
 import pickle
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from sklearn.preprocessing import normalize
 import re
-import nltk
 import string
-import io
+from collections import Counter
 from ats_scorer import calculate_ats_score, generate_improvement_suggestions
 
 # from sklearn.feature_extraction.text import TfidfVectorizer
 # tfidf = TfidfVectorizer(stop_words='english')
 
+# Check for optional extraction libraries; show tips if missing
+@st.cache_resource
+def _load_extractors():
+    """Probe the optional PDF/DOCX libraries once per process.
 
-nltk.download('punkt')
-nltk.download('stopwords')
+    A failed import is not cached in sys.modules, so probing on every rerun
+    would repeat the module search each time a library is absent.
+    """
+    missing = []
+    try:
+        from PyPDF2 import PdfReader
+    except Exception:
+        PdfReader = None
+        missing.append('PyPDF2')
+    try:
+        from docx import Document
+    except Exception:
+        Document = None
+        missing.append('python-docx')
+    return PdfReader, Document, tuple(missing)
 
-# Check for optional extraction libraries; show tips if missing
-MISSING_EXTRACTOR_LIBS = []
-try:
-    import PyPDF2  # noqa: F401
-except Exception:
-    MISSING_EXTRACTOR_LIBS.append('PyPDF2')
-try:
-    import docx  # noqa: F401
-except Exception:
-    MISSING_EXTRACTOR_LIBS.append('python-docx')
+
+_PdfReader, _DocxDocument, MISSING_EXTRACTOR_LIBS = _load_extractors()
+
+# Patterns/tables used by cleanResume, built once instead of on every call.
+# URL, @mention, #hashtag and RT/cc markers are stripped in a single pass.
+# Non-ASCII characters are dropped before punctuation is deleted with
+# str.translate: on pure-ASCII text translate takes its fast path, while on
+# raw resumes (which contain non-ASCII text) it is slower than a regex.
+_RE_TOKENS = re.compile(r'http\S+|[@#]\S+|\bRT\b|\bcc\b')
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+_RE_WS = re.compile(r'\s+')
+
+
+# Optional Hyperscan database for the token-stripping pass of cleanResume.
+# Each pattern must end at whitespace or end-of-text so Hyperscan reports one
+# match per token instead of one per end offset of the greedy \S+.
+# Hyperscan's \s is ASCII-only (\b cannot be combined with its Unicode
+# mode), so the class spells out the other characters Python's re treats as
+# whitespace. \b is ASCII-only as well, so it also matches RT/cc next to a
+# non-ASCII letter or digit (e.g. 'écc'), where re's Unicode \b does not;
+# _strip_tokens re-checks those boundaries the way re does.
+_HS_SPACE = (rb'\s\x1c-\x1f\x{85}\x{a0}\x{1680}\x{2000}-\x{200a}'
+             rb'\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}')
+_HS_TOKEN_END = rb'([' + _HS_SPACE + rb']|$)'
+_HS_NON_SPACE = rb'[^' + _HS_SPACE + rb']'
+
+
+@st.cache_resource
+def _load_token_scanner():
+    """Compile the Hyperscan database once per process (None if unavailable)."""
+    try:
+        import hyperscan
+    except Exception:
+        return None
+    patterns = [
+        rb'http' + _HS_NON_SPACE + rb'+' + _HS_TOKEN_END,
+        rb'[@#]' + _HS_NON_SPACE + rb'+' + _HS_TOKEN_END,
+        rb'\bRT\b',
+        rb'\bcc\b',
+    ]
+    flags = hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8
+    db = hyperscan.Database()
+    db.compile(expressions=patterns, ids=list(range(len(patterns))), flags=[flags] * len(patterns))
+    return db
+
+
+_TOKEN_SCANNER = _load_token_scanner()
+
+
+def _is_word_char(c):
+    """Match re's Unicode \\w (an empty string is not a word character)."""
+    return c.isalnum() or c == '_'
+
+
+def _has_word_boundaries(data, start, end):
+    """Whether the UTF-8 span data[start:end] has re-style \\b on both sides."""
+    # a UTF-8 character is at most 4 bytes; partial sequences decode to nothing
+    before = data[max(0, start - 4):start].decode('utf-8', 'ignore')[-1:]
+    after = data[end:end + 4].decode('utf-8', 'ignore')[:1]
+    return not (_is_word_char(before) or _is_word_char(after))
+
+
+def _strip_tokens(txt):
+    """Replace URLs, @mentions, #hashtags and RT/cc markers with a space."""
+    if _TOKEN_SCANNER is None:
+        return _RE_TOKENS.sub(' ', txt)
+
+    data = txt.encode('utf-8', 'ignore')
+    spans = []
+
+    def on_match(pattern_id, start, end, flags, context):
+        # patterns 2 and 3 are the \b-delimited RT/cc markers
+        if pattern_id >= 2 and not _has_word_boundaries(data, start, end):
+            return
+        spans.append((start, end))
+
+    _TOKEN_SCANNER.scan(data, match_event_handler=on_match)
+    if not spans:
+        return txt
+
+    # Matches may overlap (e.g. 'cc' inside a URL); cut out their union
+    spans.sort()
+    parts = []
+    pos = 0
+    for start, end in spans:
+        if start > pos:
+            parts.append(data[pos:start])
+        pos = max(pos, end)
+    parts.append(data[pos:])
+    return b' '.join(parts).decode('utf-8', 'ignore')
+
+
+# Optional Numba kernel for the rest of cleanResume: punctuation removal,
+# whitespace collapsing and stripping in one pass over the ASCII bytes.
+# The space mask holds the ASCII characters re's \s matches.
+_PUNCT_MASK = np.zeros(128, dtype=np.bool_)
+_PUNCT_MASK[np.frombuffer(string.punctuation.encode('ascii'), dtype=np.uint8)] = True
+_SPACE_MASK = np.zeros(128, dtype=np.bool_)
+_SPACE_MASK[np.frombuffer(b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f', dtype=np.uint8)] = True
+
+
+@st.cache_resource
+def _load_clean_kernel():
+    """JIT-compile the byte cleaning kernel once per process (None if unavailable)."""
+    try:
+        import numba
+    except Exception:
+        return None
+
+    @numba.njit
+    def clean_bytes(buf, punct, space):
+        out = np.empty_like(buf)
+        n = 0
+        pending_space = False
+        for c in buf:
+            if punct[c]:
+                continue
+            if space[c]:
+                # leading whitespace is dropped, runs become one space
+                pending_space = n > 0
+                continue
+            if pending_space:
+                out[n] = 32
+                n += 1
+                pending_space = False
+            out[n] = c
+            n += 1
+        return out[:n]
+
+    # compile for the read-only buffers cleanResume passes (np.frombuffer)
+    clean_bytes(np.frombuffer(b'', dtype=np.uint8), _PUNCT_MASK, _SPACE_MASK)
+    return clean_bytes
+
+
+_CLEAN_KERNEL = _load_clean_kernel()
 
 # loading models
-clf = pickle.load(open('resume_scanner/clf.pkl', 'rb'))
-tfidf = pickle.load(open('resume_scanner/tfidf.pkl', 'rb'))
+@st.cache_resource
+def _load_models():
+    """Unpickle the classifier, vectorizer and label encoder once per process.
+
+    Streamlit re-executes this script on every interaction; caching the
+    loaded objects keeps reruns from re-reading and re-unpickling them.
+    """
+    with open('resume_scanner/clf.pkl', 'rb') as f:
+        clf = pickle.load(f)
+    with open('resume_scanner/tfidf.pkl', 'rb') as f:
+        tfidf = pickle.load(f)
+
+    # Try to load LabelEncoder created at training time to correctly map
+    # model numeric predictions back to original category names.
+    try:
+        with open('resume_scanner/label_encoder.pkl', 'rb') as f:
+            le = pickle.load(f)
+    except Exception:
+        le = None
+
+    return clf, tfidf, le
+
+
+clf, tfidf, le = _load_models()
+CLF_CLASSES = np.asarray(clf.classes_)
+# Class names indexed by label id, so mapping a prediction is a plain lookup
+LE_CLASSES = np.asarray(le.classes_) if le is not None else None
+TFIDF_IDF = np.asarray(tfidf.idf_, dtype=np.float64) if tfidf.use_idf else None
+# Built once here rather than inside every tfidf.transform call
+TFIDF_ANALYZER = tfidf.build_analyzer()
+TFIDF_VOCAB = tfidf.vocabulary_
+
+
+# Optional Numba kernel fusing the idf scaling and L2 row normalization of
+# vectorize_resumes into one pass over the CSR data.
+@st.cache_resource
+def _load_tfidf_kernel(_idf):
+    """JIT-compile the tf-idf scaling kernel once per process (None if unavailable)."""
+    try:
+        import numba
+    except Exception:
+        return None
+
+    @numba.njit
+    def scale_rows(data, indices, indptr, idf):
+        for i in range(indptr.shape[0] - 1):
+            norm = 0.0
+            for j in range(indptr[i], indptr[i + 1]):
+                data[j] *= idf[indices[j]]
+                norm += data[j] * data[j]
+            if norm > 0.0:
+                norm = np.sqrt(norm)
+                for j in range(indptr[i], indptr[i + 1]):
+                    data[j] /= norm
+
+    # compile for the arrays vectorize_resumes passes, including the idf itself
+    scale_rows(np.zeros(0), np.zeros(0, dtype=np.int32), np.zeros(1, dtype=np.int32), _idf)
+    return scale_rows
+
+
+_TFIDF_KERNEL = _load_tfidf_kernel(TFIDF_IDF) if TFIDF_IDF is not None and tfidf.norm == 'l2' else None
 
 # Mapping of category IDs to human-readable names (legacy/fallback)
 CATEGORY_NAMES = [
@@ -43,60 +247,133 @@ CATEGORY_IDS = [6, 12, 0, 1, 24, 16, 22, 14, 5, 15, 4, 21, 2, 11, 18, 20, 8, 17,
 # Build a mapping from id -> name (legacy fallback)
 ID_TO_CATEGORY = {cid: name for name, cid in zip(CATEGORY_NAMES, CATEGORY_IDS)}
 
-# Try to load LabelEncoder created at training time to correctly map
-# model numeric predictions back to original category names.
-try:
-    le = pickle.load(open('label_encoder.pkl', 'rb'))
-except Exception:
-    le = None
-
 
 def map_id_to_category(cid):
     """Return a human-readable category name for a numeric id or label index.
 
-    Prefer using the saved LabelEncoder if available (most reliable). If the
-    encoder is not present, fall back to the legacy ID_TO_CATEGORY mapping.
+    Prefer the class names of the saved LabelEncoder if available (most
+    reliable). If the encoder is not present or the id is out of its range,
+    fall back to the legacy ID_TO_CATEGORY mapping.
     """
     try:
         cid_int = int(cid)
-        if le is not None:
-            try:
-                return le.inverse_transform([cid_int])[0]
-            except Exception:
-                pass
-        return ID_TO_CATEGORY.get(cid_int, 'Unknown')
     except Exception:
         return 'Unknown'
+    if LE_CLASSES is not None and 0 <= cid_int < len(LE_CLASSES):
+        return str(LE_CLASSES[cid_int])
+    return ID_TO_CATEGORY.get(cid_int, 'Unknown')
+
+
+def vectorize_resumes(docs):
+    """TF-IDF transform cleaned resume texts with the fitted vectorizer.
+
+    Equivalent to tfidf.transform(docs), but terms are counted with the
+    analyzer and vocabulary cached at load time, and the idf weights are
+    applied by scaling the count matrix's data in place (a gather + multiply)
+    instead of going through TfidfTransformer, which validates/copies the
+    matrix and on older scikit-learn multiplies by a sparse diagonal matrix.
+    """
+    indices, values, indptr = [], [], [0]
+    for doc in docs:
+        counts = Counter(map(TFIDF_VOCAB.get, TFIDF_ANALYZER(doc)))
+        counts.pop(None, None)  # out-of-vocabulary terms
+        indices.extend(counts.keys())
+        values.extend(counts.values())
+        indptr.append(len(indices))
+    X = sp.csr_matrix(
+        (np.asarray(values, dtype=np.float64), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int32)),
+        shape=(len(docs), len(TFIDF_VOCAB)),
+    )
+    X.sort_indices()
+    if tfidf.binary:
+        X.data.fill(1)
+    if tfidf.sublinear_tf:
+        np.log(X.data, out=X.data)
+        X.data += 1.0
+    if _TFIDF_KERNEL is not None:
+        _TFIDF_KERNEL(X.data, X.indices, X.indptr, TFIDF_IDF)
+        return X
+    if TFIDF_IDF is not None:
+        np.multiply(X.data, TFIDF_IDF.take(X.indices), out=X.data)
+    if tfidf.norm is not None:
+        X = normalize(X, norm=tfidf.norm, copy=False)
+    return X
+
+
+def predict_category_ids(features):
+    """Predict the labels of vectorized resumes (one row per resume).
+
+    Linear models expose decision_function, so labels are taken straight
+    from the argmax of its scores; other classifiers go through predict.
+    """
+    if hasattr(clf, 'decision_function'):
+        scores = clf.decision_function(features)
+        if scores.ndim == 1:
+            # binary classifiers return one signed score per sample
+            return CLF_CLASSES[(scores > 0).astype(int)].astype(int).tolist()
+        return CLF_CLASSES[np.argmax(scores, axis=1)].astype(int).tolist()
+    return clf.predict(features).astype(int).tolist()
 
 
-# Helper to extract text from uploaded files (PDF / DOCX / fallback)
-def extract_text_from_bytes(file_bytes, filename='file'):
+# Streamlit sends widget values to the browser on every rerun, even inside a
+# collapsed expander, so resume previews are capped at this many characters.
+PREVIEW_MAX_CHARS = 4000
+
+
+def preview_text(text, limit=PREVIEW_MAX_CHARS):
+    """Return text truncated to `limit` characters for read-only previews."""
+    if len(text) > limit:
+        return text[:limit] + '…'
+    return text
+
+
+# The classifier stops PDF parsing after the page that brings the extracted
+# text past this many characters; its prediction is settled well before it.
+# The ATS checker reads the whole file, since a late section or keyword
+# changes its score.
+PDF_MAX_CHARS = 20_000
+
+
+# Helper to extract text from uploaded files (PDF / DOCX / fallback).
+# The UploadedFile is already an in-memory BytesIO, so parsers read from it
+# directly instead of from a second copy of its bytes. With max_chars, PDF
+# parsing stops after the page that brings the text past that many characters.
+def extract_text_from_file(uploaded_file, max_chars=None):
+    filename = uploaded_file.name
     ext = filename.split('.')[-1].lower() if filename and '.' in filename else ''
 
     # PDF
-    if ext == 'pdf':
+    if ext == 'pdf' and _PdfReader is not None:
         try:
-            from PyPDF2 import PdfReader
-            reader = PdfReader(io.BytesIO(file_bytes))
-            text = ''
+            uploaded_file.seek(0)
+            reader = _PdfReader(uploaded_file)
+            parts = []
+            total_chars = 0
             for page in reader.pages:
                 # extract_text may return None for some pages
-                text += page.extract_text() or ''
+                page_text = page.extract_text()
+                if page_text:
+                    parts.append(page_text)
+                    total_chars += len(page_text)
+                    if max_chars is not None and total_chars >= max_chars:
+                        break
+            text = ''.join(parts)
             if text.strip():
                 return text
         except Exception:
             pass
 
     # DOCX
-    if ext == 'docx':
+    if ext == 'docx' and _DocxDocument is not None:
         try:
-            from docx import Document
-            doc = Document(io.BytesIO(file_bytes))
+            uploaded_file.seek(0)
+            doc = _DocxDocument(uploaded_file)
             return '\n'.join([p.text for p in doc.paragraphs])
         except Exception:
             pass
 
     # Fallback: try decoding bytes directly
+    file_bytes = uploaded_file.getvalue()
     try:
         return file_bytes.decode('utf-8', errors='ignore')
     except Exception:
@@ -105,17 +382,27 @@ def extract_text_from_bytes(file_bytes, filename='file'):
 
 def cleanResume(txt):
     
-    cleanTxt = re.sub(r'http\S+', ' ', txt)
-    cleanTxt = re.sub(r'@\S+', '', cleanTxt)
-    cleanTxt = re.sub(r'#\S+', '', cleanTxt)
-    cleanTxt = re.sub(r'RT||cc', '', cleanTxt)
-    # cleanTxt = re.sub(r'[%s]' % re.escape("""!"#$%&'()*+,-./:;<=>?@[\]^_`{|}~"""), '', cleanTxt)
-    cleanTxt = re.sub(rf"[{re.escape(string.punctuation)}]", "", cleanTxt)
-    cleanTxt = re.sub(r'[^\x00-\x7f]', '', cleanTxt)
-    cleanTxt = re.sub(r'\s+', ' ', cleanTxt)
+    cleanTxt = _strip_tokens(txt)
+    if _CLEAN_KERNEL is not None:
+        buf = np.frombuffer(cleanTxt.encode('ascii', 'ignore'), dtype=np.uint8)
+        return _CLEAN_KERNEL(buf, _PUNCT_MASK, _SPACE_MASK).tobytes().decode('ascii')
+    cleanTxt = cleanTxt.encode('ascii', 'ignore').decode('ascii')
+    cleanTxt = cleanTxt.translate(_PUNCT_TABLE)
+    cleanTxt = _RE_WS.sub(' ', cleanTxt).strip()
     
     return cleanTxt
 
+
+# Reruns (re-clicks, re-uploads of the same file) reuse results keyed on text
+@st.cache_data(show_spinner=False)
+def _cached_clean_resume(txt):
+    return cleanResume(txt)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_vectorize_resume(cleaned_txt):
+    return vectorize_resumes([cleaned_txt])
+
 #webapp
 def main():
     st.set_page_config(page_title="Resume Scanner & ATS Checker", layout="wide")
@@ -138,33 +425,47 @@ def main():
 def resume_classifier_mode():
     """Original resume classification functionality."""
     st.header("Resume Classifier")
-    st.write("Upload a resume to classify it into a job category.")
+    st.write("Upload one or more resumes to classify them into job categories.")
     
-    uploaded_file = st.file_uploader("Upload your Resume", type=["pdf", "docx", "doc"])
+    uploaded_files = st.file_uploader("Upload your Resume(s)", type=["pdf", "docx", "doc"], accept_multiple_files=True)
     
-    if uploaded_file is not None:
-        # read bytes once and extract text depending on file type
-        resume_bytes = uploaded_file.read()
-        resume_text = extract_text_from_bytes(resume_bytes, uploaded_file.name)
-
-        # If we couldn't extract meaningful text from PDF/DOCX, warn the user
-        if uploaded_file.name.lower().endswith((".pdf", ".docx")) and (not resume_text or len(resume_text.strip()) < 20):
-            st.warning("Could not reliably extract text from this file. Install `PyPDF2` and `python-docx`, or provide a plain text/Word resume.")
-
-        cleaned_resume = cleanResume(resume_text)
-        cleaned_resume_tfidf = tfidf.transform([cleaned_resume])
-        prediction = clf.predict(cleaned_resume_tfidf)[0]
-        category_name = map_id_to_category(prediction)
-        
-        # Display results
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Predicted Job Role", category_name)
-        with col2:
-            st.metric("Category ID", prediction)
-        
-        with st.expander("View Extracted Resume Text"):
-            st.text_area("Resume Text", value=resume_text, height=200, disabled=True)
+    if uploaded_files:
+        resume_texts = []
+        for uploaded_file in uploaded_files:
+            # extract text depending on file type
+            resume_text = extract_text_from_file(uploaded_file, max_chars=PDF_MAX_CHARS)
+
+            # If we couldn't extract meaningful text from PDF/DOCX, warn the user
+            if uploaded_file.name.lower().endswith((".pdf", ".docx")) and (not resume_text or len(resume_text.strip()) < 20):
+                st.warning(f"Could not reliably extract text from {uploaded_file.name}. Install `PyPDF2` and `python-docx`, or provide a plain text/Word resume.")
+            resume_texts.append(resume_text)
+
+        if len(uploaded_files) == 1:
+            resume_text = resume_texts[0]
+            cleaned_resume = _cached_clean_resume(resume_text)
+            cleaned_resume_tfidf = _cached_vectorize_resume(cleaned_resume)
+            prediction = predict_category_ids(cleaned_resume_tfidf)[0]
+            category_name = map_id_to_category(prediction)
+            
+            # Display results
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Predicted Job Role", category_name)
+            with col2:
+                st.metric("Category ID", prediction)
+            
+            with st.expander("View Extracted Resume Text"):
+                st.text_area("Resume Text", value=preview_text(resume_text), height=200, disabled=True)
+        else:
+            # Vectorize and classify the whole batch with one call each
+            cleaned_resumes = [_cached_clean_resume(text) for text in resume_texts]
+            predictions = predict_category_ids(vectorize_resumes(cleaned_resumes))
+            results = pd.DataFrame({
+                "File": [f.name for f in uploaded_files],
+                "Predicted Job Role": [map_id_to_category(p) for p in predictions],
+                "Category ID": predictions,
+            })
+            st.dataframe(results, hide_index=True, use_container_width=True)
 
 
 def ats_checker_mode():
@@ -184,15 +485,14 @@ def ats_checker_mode():
         resume_text = None
         
         if uploaded_file is not None:
-            resume_bytes = uploaded_file.read()
-            resume_text = extract_text_from_bytes(resume_bytes, uploaded_file.name)
+            resume_text = extract_text_from_file(uploaded_file)
             
             if uploaded_file.name.lower().endswith((".pdf", ".docx")) and (not resume_text or len(resume_text.strip()) < 20):
                 st.warning("Could not extract text reliably. Try again or use plain text.")
             else:
                 st.success(f"✅ Resume loaded ({len(resume_text.split())} words)")
                 with st.expander("View Resume Text"):
-                    st.text_area("Resume", value=resume_text, height=150, disabled=True, key="resume_preview")
+                    st.text_area("Resume", value=preview_text(resume_text), height=150, disabled=True, key="resume_preview")
     
     with col2:
         st.subheader("📋 Job Description")
@@ -216,6 +516,11 @@ def ats_checker_mode():
                 # Calculate ATS score
                 ats_result = calculate_ats_score(resume_text, jd_text)
                 
+                # Too little text: there is no breakdown to show
+                if ats_result['unscored']:
+                    st.warning(f"⚠️ {ats_result['unscored_reason']}")
+                    return
+                
                 # Display final score with color coding
                 st.markdown("---")
                 st.subheader("📊 ATS Score Results")
@@ -244,37 +549,38 @@ def ats_checker_mode():
                 st.markdown("### Score Breakdown by Component")
                 components = ats_result['components']
                 
-                score_cols = st.columns(5)
-                with score_cols[0]:
-                    st.metric(
-                        "Keyword Matching",
-                        f"{components['keyword_matching']['score']}/40",
-                        help=f"Matched: {components['keyword_matching']['details']['matched_count']}/{components['keyword_matching']['details']['total_jd_keywords']}"
-                    )
-                with score_cols[1]:
-                    st.metric(
-                        "Resume Sections",
-                        f"{components['resume_sections']['score']}/20",
-                        help=f"Detected: {components['resume_sections']['details']['detected_count']}/5"
-                    )
-                with score_cols[2]:
-                    st.metric(
-                        "Formatting",
-                        f"{components['formatting_heuristics']['score']}/10",
-                        help=f"Words: {components['formatting_heuristics']['details']['word_count']}"
-                    )
-                with score_cols[3]:
-                    st.metric(
-                        "Action Verbs",
-                        f"{components['action_verbs']['score']}/10",
-                        help=f"Count: {components['action_verbs']['details']['action_verb_count']}"
-                    )
-                with score_cols[4]:
-                    st.metric(
-                        "Semantic Match",
-                        f"{components['semantic_similarity']['score']}/10",
-                        help=f"{components['semantic_similarity']['details']['interpretation']}"
-                    )
+                score_breakdown = pd.DataFrame(
+                    [
+                        (
+                            "Keyword Matching",
+                            f"{components['keyword_matching']['score']}/40",
+                            f"Matched: {components['keyword_matching']['details']['matched_count']}/{components['keyword_matching']['details']['total_jd_keywords']}"
+                        ),
+                        (
+                            "Resume Sections",
+                            f"{components['resume_sections']['score']}/20",
+                            f"Detected: {components['resume_sections']['details']['detected_count']}/5"
+                        ),
+                        (
+                            "Formatting",
+                            f"{components['formatting_heuristics']['score']}/10",
+                            f"Words: {components['formatting_heuristics']['details']['word_count']}"
+                        ),
+                        (
+                            "Action Verbs",
+                            f"{components['action_verbs']['score']}/10",
+                            f"Count: {components['action_verbs']['details']['action_verb_count']}"
+                        ),
+                        (
+                            "Semantic Match",
+                            f"{components['semantic_similarity']['score']}/10",
+                            f"{components['semantic_similarity']['details']['interpretation']}"
+                        ),
+                    ],
+                    columns=["Component", "Score", "Details"]
+                )
+                # One table instead of a column + metric widget per component
+                st.dataframe(score_breakdown, hide_index=True, use_container_width=True)
                 
                 # Detailed Analysis
                 st.markdown("### Detailed Analysis")
@@ -17,16 +17,16 @@ Author: ATS Scoring System
 import re
 import string
 from collections import Counter
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS, TfidfVectorizer
 
 
 # ==================== CONSTANTS ====================
 
 # Strong action verbs that indicate impactful experience
-STRONG_ACTION_VERBS = {
+STRONG_ACTION_VERBS = frozenset({
     'built', 'developed', 'created', 'designed', 'engineered', 'architected',
     'optimized', 'improved', 'enhanced', 'accelerated', 'automated', 'streamlined',
     'led', 'managed', 'coordinated', 'orchestrated', 'directed', 'supervised',
@@ -36,7 +36,7 @@ STRONG_ACTION_VERBS = {
     'increased', 'decreased', 'reduced', 'maximized', 'minimized', 'scaled',
     'integrated', 'consolidated', 'merged', 'combined', 'unified', 'aligned',
     'awarded', 'recognized', 'certified', 'promoted', 'selected', 'chosen'
-}
+})
 
 # Resume sections to detect
 RESUME_SECTIONS = {
@@ -47,9 +47,116 @@ RESUME_SECTIONS = {
     'projects': r'\b(projects|portfolio|personal projects|key projects)\b'
 }
 
+# Inputs shorter than this (in words) are too short to score and get a zero result
+MIN_RESUME_WORDS = 10
+MIN_JD_WORDS = 5
+
+# Points for each detected resume section (20 points / 5 sections)
+POINTS_PER_SECTION = 4
+
+ACTION_VERB_BENCHMARK = '5-10+ strong action verbs for competitive resume'
+SIMILARITY_METHOD = 'TF-IDF Cosine Similarity'
+
+# TF-IDF settings for the semantic similarity score
+SIMILARITY_MAX_FEATURES = 100
+_SIMILARITY_VECTORIZER_PARAMS = dict(
+    max_features=SIMILARITY_MAX_FEATURES,
+    ngram_range=(1, 2),
+    stop_words='english'
+)
+
+# Precompiled RESUME_SECTIONS patterns (fallback when pyahocorasick is absent)
+_SECTION_PATTERNS = {name: re.compile(pattern) for name, pattern in RESUME_SECTIONS.items()}
+
+# A plain r'\b(term|term|...)\b' section pattern; terms are words/spaces and
+# escaped dots, starting and ending with a word character
+_SECTION_TERMS_RE = re.compile(r'\\b\((.+)\)\\b')
+_SECTION_TERM_RE = re.compile(r'\w(?:[\w ]|\\\.)*\w|\w')
+
+# Byte lookup table for the special-character ratio in score_formatting_heuristics:
+# ASCII punctuation except the common '.', '-' and ','
+_SPECIAL_CHAR_MASK = np.zeros(256, dtype=bool)
+_SPECIAL_CHAR_MASK[np.frombuffer(string.punctuation.encode('ascii'), dtype=np.uint8)] = True
+_SPECIAL_CHAR_MASK[np.frombuffer(b'.-,', dtype=np.uint8)] = False
+
+# Patterns used by preprocess_text, compiled once at import
+_URL_EMAIL_RE = re.compile(r'http\S+|www\S+|\S+@\S+')
+_PUNCT_RE = re.compile(rf"[{re.escape(string.punctuation.replace('-', '').replace('.', ''))}]")
+_WS_RE = re.compile(r'\s+')
+
+# Runs of text between sentence delimiters (periods, ?, ! and newlines)
+_SENTENCE_RE = re.compile(r'[^.!?\n]+')
+
 
 # ==================== UTILITY FUNCTIONS ====================
 
+def _build_section_automaton():
+    """
+    Build an Aho-Corasick automaton over the RESUME_SECTIONS header terms.
+    
+    Lets score_resume_sections find every section in one scan of the resume
+    instead of one regex search per section. Returns None if pyahocorasick
+    is not installed or a pattern is not a plain word alternation.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    
+    term_sections = {}
+    for section_name, pattern in RESUME_SECTIONS.items():
+        match = _SECTION_TERMS_RE.fullmatch(pattern)
+        if match is None:
+            return None
+        for term in match.group(1).split('|'):
+            if not _SECTION_TERM_RE.fullmatch(term):
+                return None
+            term_sections.setdefault(term.replace('\\.', '.'), set()).add(section_name)
+    
+    automaton = ahocorasick.Automaton()
+    for term, sections in term_sections.items():
+        automaton.add_word(term, (len(term), tuple(sections)))
+    automaton.make_automaton()
+    return automaton
+
+
+_SECTION_AUTOMATON = _build_section_automaton()
+
+
+def _is_word_char(c: str) -> bool:
+    """Match the regex \\w definition used for \\b boundaries."""
+    return c.isalnum() or c == '_'
+
+
+def find_resume_sections(resume_lower: str) -> set:
+    """
+    Return the names of RESUME_SECTIONS whose pattern occurs in the text.
+    
+    Args:
+        resume_lower: Lowercased resume text
+        
+    Returns:
+        Set of detected section names
+    """
+    if _SECTION_AUTOMATON is None:
+        return {name for name, pattern in _SECTION_PATTERNS.items() if pattern.search(resume_lower)}
+    
+    found = set()
+    last = len(resume_lower) - 1
+    for end, (length, sections) in _SECTION_AUTOMATON.iter(resume_lower):
+        start = end - length + 1
+        # Enforce the \b boundaries of the original patterns
+        if start > 0 and _is_word_char(resume_lower[start - 1]):
+            continue
+        if end < last and _is_word_char(resume_lower[end + 1]):
+            continue
+        found.update(sections)
+        if len(found) == len(RESUME_SECTIONS):
+            break
+    return found
+
+
+@lru_cache(maxsize=256)
 def preprocess_text(text: str) -> str:
     """
     Clean and preprocess text for analysis.
@@ -62,14 +169,12 @@ def preprocess_text(text: str) -> str:
     """
     # Convert to lowercase
     text = text.lower()
-    # Remove URLs
-    text = re.sub(r'http\S+|www\S+', '', text)
-    # Remove email addresses
-    text = re.sub(r'\S+@\S+', '', text)
+    # Remove URLs and email addresses in a single pass
+    text = _URL_EMAIL_RE.sub('', text)
     # Remove special characters but keep hyphens and periods
-    text = re.sub(rf"[{re.escape(string.punctuation.replace('-', '').replace('.', ''))}]", '', text)
+    text = _PUNCT_RE.sub('', text)
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WS_RE.sub(' ', text).strip()
     return text
 
 
@@ -85,9 +190,14 @@ def extract_keywords(text: str, min_length: int = 3, max_keywords: int = 50) ->
     Returns:
         List of extracted keywords sorted by importance
     """
-    words = preprocess_text(text).split()
-    # Filter by minimum length
-    words = [w for w in words if len(w) >= min_length]
+    return _top_keywords(preprocess_text(text), min_length, max_keywords)
+
+
+def _top_keywords(processed_text: str, min_length: int, max_keywords: int) -> List[str]:
+    """extract_keywords() on text that has already been through preprocess_text()."""
+    words = processed_text.split()
+    # Filter by minimum length; drop stop words, which match almost any resume
+    words = [w for w in words if len(w) >= min_length and w not in ENGLISH_STOP_WORDS]
     
     # Count word frequencies
     word_freq = Counter(words)
@@ -97,6 +207,22 @@ def extract_keywords(text: str, min_length: int = 3, max_keywords: int = 50) ->
     return top_keywords
 
 
+def iter_sentences(text: str) -> Iterator[str]:
+    """
+    Lazily yield the sentences of a text.
+    
+    Args:
+        text: Text to split
+        
+    Yields:
+        Non-empty, stripped sentences
+    """
+    for match in _SENTENCE_RE.finditer(text):
+        sentence = match.group().strip()
+        if sentence:
+            yield sentence
+
+
 def tokenize_sentences(text: str) -> List[str]:
     """
     Split text into sentences.
@@ -107,14 +233,16 @@ def tokenize_sentences(text: str) -> List[str]:
     Returns:
         List of sentences
     """
-    # Split on periods, question marks, exclamation marks, and newlines
-    sentences = re.split(r'[.!?\n]+', text)
-    return [s.strip() for s in sentences if s.strip()]
+    return list(iter_sentences(text))
 
 
 # ==================== SCORING FUNCTIONS ====================
 
-def score_keyword_matching(resume_text: str, jd_text: str) -> Tuple[float, Dict]:
+def score_keyword_matching(resume_text: str, jd_text: str,
+                           resume_processed: Optional[str] = None,
+                           jd_processed: Optional[str] = None,
+                           jd_keywords: Optional[frozenset] = None,
+                           resume_words: Optional[List[str]] = None) -> Tuple[float, Dict]:
     """
     Score: Keyword Matching (40% weight)
     
@@ -124,20 +252,31 @@ def score_keyword_matching(resume_text: str, jd_text: str) -> Tuple[float, Dict]
     Args:
         resume_text: Resume text
         jd_text: Job Description text
+        resume_processed: preprocess_text(resume_text), if already computed
+        jd_processed: preprocess_text(jd_text), if already computed
+        jd_keywords: Top JD keywords, if already computed (see JDContext)
+        resume_words: resume_processed.split(), if already computed
         
     Returns:
         Tuple of (score: float 0-40, metadata: dict with details)
     """
+    if resume_words is None:
+        if resume_processed is None:
+            resume_processed = preprocess_text(resume_text)
+        resume_words = resume_processed.split()
+    
     # Extract keywords from JD
-    jd_keywords = set(extract_keywords(jd_text, max_keywords=40))
+    if jd_keywords is None:
+        if jd_processed is None:
+            jd_processed = preprocess_text(jd_text)
+        jd_keywords = frozenset(_top_keywords(jd_processed, min_length=3, max_keywords=40))
     
-    # Preprocess resume text
-    resume_processed = preprocess_text(resume_text)
-    resume_words = set(resume_processed.split())
+    # Unique words of the preprocessed resume text
+    resume_vocab = set(resume_words)
     
     # Find matched keywords
-    matched_keywords = jd_keywords.intersection(resume_words)
-    missing_keywords = jd_keywords - resume_words
+    matched_keywords = jd_keywords.intersection(resume_vocab)
+    missing_keywords = jd_keywords - resume_vocab
     
     # Calculate score
     total_keywords = len(jd_keywords) if jd_keywords else 1
@@ -167,12 +306,10 @@ def score_resume_sections(resume_text: str) -> Tuple[float, Dict]:
         Tuple of (score: float 0-20, metadata: dict with details)
     """
     resume_lower = resume_text.lower()
-    sections_found = {}
-    points_per_section = 4  # 20 points / 5 sections
+    points_per_section = POINTS_PER_SECTION
     
-    for section_name, pattern in RESUME_SECTIONS.items():
-        found = bool(re.search(pattern, resume_lower))
-        sections_found[section_name] = found
+    detected = find_resume_sections(resume_lower)
+    sections_found = {section_name: section_name in detected for section_name in RESUME_SECTIONS}
     
     # Calculate score
     detected_count = sum(1 for found in sections_found.values() if found)
@@ -224,7 +361,9 @@ def score_formatting_heuristics(resume_text: str) -> Tuple[float, Dict]:
         details['penalties'].append(f'Too many words ({word_count}): -{penalty}pts')
     
     # Check special character ratio (excluding common ones like hyphens, periods)
-    special_chars = sum(1 for c in resume_text if c in string.punctuation and c not in '.-,')
+    # (all of string.punctuation is ASCII, so counting UTF-8 bytes is exact)
+    text_bytes = np.frombuffer(resume_text.encode('utf-8', 'ignore'), dtype=np.uint8)
+    special_chars = int(_SPECIAL_CHAR_MASK[text_bytes].sum())
     special_char_ratio = special_chars / len(resume_text) if resume_text else 0
     details['special_char_ratio'] = round(special_char_ratio, 4)
     
@@ -248,7 +387,8 @@ def score_formatting_heuristics(resume_text: str) -> Tuple[float, Dict]:
     return score, details
 
 
-def score_action_verbs(resume_text: str) -> Tuple[float, Dict]:
+def score_action_verbs(resume_text: str, resume_processed: Optional[str] = None,
+                       resume_words: Optional[List[str]] = None) -> Tuple[float, Dict]:
     """
     Score: Action Verbs & Impact Language (10% weight)
     
@@ -256,15 +396,19 @@ def score_action_verbs(resume_text: str) -> Tuple[float, Dict]:
     
     Args:
         resume_text: Resume text
+        resume_processed: preprocess_text(resume_text), if already computed
+        resume_words: resume_processed.split(), if already computed
         
     Returns:
         Tuple of (score: float 0-10, metadata: dict with details)
     """
-    resume_lower = resume_text.lower()
+    if resume_words is None:
+        if resume_processed is None:
+            resume_processed = preprocess_text(resume_text)
+        resume_words = resume_processed.split()
     # Find words that are action verbs
-    words = preprocess_text(resume_lower).split()
-    
-    action_verb_count = sum(1 for word in words if word in STRONG_ACTION_VERBS)
+    verbs_found = [word for word in resume_words if word in STRONG_ACTION_VERBS]
+    action_verb_count = len(verbs_found)
     
     # Scale: aim for 5+ action verbs for full score
     # 0-5 verbs: 0-6 points
@@ -276,12 +420,74 @@ def score_action_verbs(resume_text: str) -> Tuple[float, Dict]:
     
     return score, {
         'action_verb_count': action_verb_count,
-        'verbs_found': [w for w in words if w in STRONG_ACTION_VERBS],
-        'benchmark': '5-10+ strong action verbs for competitive resume'
+        'verbs_found': verbs_found,
+        'benchmark': ACTION_VERB_BENCHMARK
     }
 
 
-def score_semantic_similarity(resume_text: str, jd_text: str) -> Tuple[float, Dict]:
+@lru_cache(maxsize=256)
+def _tfidf_similarity(resume_processed: str, jd_processed: str) -> float:
+    """
+    TF-IDF cosine similarity of two preprocessed texts.
+    
+    The vectorizer is fit on the pair (the idf depends on both texts), so
+    results are memoized per (resume, JD) pair rather than per text.
+    """
+    vectorizer = TfidfVectorizer(**_SIMILARITY_VECTORIZER_PARAMS)
+    
+    # Fit and transform both texts
+    vectors = vectorizer.fit_transform([resume_processed, jd_processed])
+    
+    # Rows are already L2-normalized by the vectorizer, so their cosine
+    # similarity is just the dot product; at <= 100 features a dense copy
+    # is far cheaper than elementwise sparse multiplication
+    resume_vec, jd_vec = vectors.toarray()
+    return float(resume_vec @ jd_vec)
+
+
+# Analyzer of the similarity vectorizer, for scoring without refitting it
+_SIMILARITY_ANALYZER = TfidfVectorizer(**_SIMILARITY_VECTORIZER_PARAMS).build_analyzer()
+
+
+def _tfidf_similarities(resumes_processed: List[str], jd_processed: str) -> List[Optional[float]]:
+    """
+    _tfidf_similarity() of each resume against one JD, analyzing the JD once.
+    
+    Reproduces the per-pair vectorizer fit from term counts: the
+    alphabetical vocabulary of the pair, its top SIMILARITY_MAX_FEATURES
+    terms by count, smoothed idf over 2 documents and L2-normalized rows.
+    Returns None for a pair with no terms, where the fit would raise.
+    """
+    jd_counts = Counter(_SIMILARITY_ANALYZER(jd_processed))
+    similarities = []
+    for resume_processed in resumes_processed:
+        resume_counts = Counter(_SIMILARITY_ANALYZER(resume_processed))
+        terms = sorted(resume_counts.keys() | jd_counts.keys())
+        if not terms:
+            similarities.append(None)
+            continue
+        resume_tf = np.array([resume_counts.get(term, 0) for term in terms], dtype=np.int64)
+        jd_tf = np.array([jd_counts.get(term, 0) for term in terms], dtype=np.int64)
+        
+        if len(terms) > SIMILARITY_MAX_FEATURES:
+            # Same selection (and tie order) as CountVectorizer's max_features
+            keep = np.sort((-(resume_tf + jd_tf)).argsort()[:SIMILARITY_MAX_FEATURES])
+            resume_tf = resume_tf[keep]
+            jd_tf = jd_tf[keep]
+        
+        doc_freq = (resume_tf > 0).astype(np.int64) + (jd_tf > 0)
+        idf = np.log(3 / (doc_freq + 1)) + 1
+        resume_vec = resume_tf * idf
+        jd_vec = jd_tf * idf
+        norms = np.sqrt(resume_vec @ resume_vec) * np.sqrt(jd_vec @ jd_vec)
+        similarities.append(float(resume_vec @ jd_vec / norms) if norms > 0 else 0.0)
+    return similarities
+
+
+def score_semantic_similarity(resume_text: str, jd_text: str,
+                              resume_processed: Optional[str] = None,
+                              jd_processed: Optional[str] = None,
+                              similarity: Optional[float] = None) -> Tuple[float, Dict]:
     """
     Score: Semantic Similarity (10% weight)
     
@@ -290,35 +496,30 @@ def score_semantic_similarity(resume_text: str, jd_text: str) -> Tuple[float, Di
     Args:
         resume_text: Resume text
         jd_text: Job Description text
+        resume_processed: preprocess_text(resume_text), if already computed
+        jd_processed: preprocess_text(jd_text), if already computed
+        similarity: TF-IDF similarity, if already computed
         
     Returns:
         Tuple of (score: float 0-10, metadata: dict with details)
     """
-    try:
-        # Preprocess texts
+    # Preprocess texts
+    if resume_processed is None:
         resume_processed = preprocess_text(resume_text)
+    if jd_processed is None:
         jd_processed = preprocess_text(jd_text)
-        
-        # Create TF-IDF vectors
-        vectorizer = TfidfVectorizer(
-            max_features=100,
-            ngram_range=(1, 2),
-            stop_words='english'
-        )
-        
-        # Fit and transform both texts
-        vectors = vectorizer.fit_transform([resume_processed, jd_processed])
-        
-        # Calculate cosine similarity
-        similarity = cosine_similarity(vectors[0], vectors[1])[0][0]
+    
+    try:
+        if similarity is None:
+            similarity = _tfidf_similarity(resume_processed, jd_processed)
         
         # Scale similarity (0-1) to score (0-10)
         score = similarity * 10
         
     except Exception as e:
         # Fallback: simple word overlap similarity
-        resume_words = set(preprocess_text(resume_text).split())
-        jd_words = set(preprocess_text(jd_text).split())
+        resume_words = set(resume_processed.split())
+        jd_words = set(jd_processed.split())
         
         if not jd_words:
             similarity = 0
@@ -330,37 +531,105 @@ def score_semantic_similarity(resume_text: str, jd_text: str) -> Tuple[float, Di
     
     return score, {
         'similarity_score': round(similarity, 4),
-        'method': 'TF-IDF Cosine Similarity',
+        'method': SIMILARITY_METHOD,
         'interpretation': f'{round(similarity * 100, 1)}% semantic overlap'
     }
 
 
+# ==================== JOB DESCRIPTION CONTEXT ====================
+
+class JDContext:
+    """
+    Job description prepared once for scoring many resumes against it.
+    
+    Holds the preprocessed JD text and its top keywords, so
+    calculate_ats_score() does not redo them for every resume. The
+    semantic similarity TF-IDF is still fit per (resume, JD) pair, since
+    its idf depends on both texts.
+    
+    Example:
+        jd = JDContext(jd_text)
+        results = [calculate_ats_score(resume, jd) for resume in resumes]
+    """
+    
+    def __init__(self, jd_text: str):
+        self.text = jd_text
+        self.processed = preprocess_text(jd_text)
+        self.keywords = frozenset(_top_keywords(self.processed, min_length=3, max_keywords=40))
+
+
 # ==================== MAIN SCORING ENGINE ====================
 
-def calculate_ats_score(resume_text: str, jd_text: str) -> Dict:
+def _unscorable_components(resume_word_count: int) -> List[Tuple[float, Dict]]:
     """
-    Calculate comprehensive ATS score (0-100) with breakdown by component.
+    Zero (score, details) pairs for inputs too short to score.
     
-    Components:
-    - Keyword Matching (40%)
-    - Resume Section Detection (20%)
-    - Formatting Heuristics (10%)
-    - Action Verbs & Impact Language (10%)
-    - Semantic Similarity (10%)
+    Nothing is measured; the details only carry the same keys as the
+    component scorers' so existing consumers can still read them. Results
+    built from these are flagged 'unscored'.
+    """
+    return [
+        (0.0, {
+            'matched_keywords': [],
+            'missing_keywords': [],
+            'total_jd_keywords': 1,
+            'matched_count': 0,
+            'match_percentage': 0.0
+        }),
+        (0.0, {
+            'sections_detected': {section_name: False for section_name in RESUME_SECTIONS},
+            'detected_count': 0,
+            'total_sections': len(RESUME_SECTIONS),
+            'score_per_section': POINTS_PER_SECTION
+        }),
+        (0.0, {
+            'word_count': resume_word_count,
+            'special_char_ratio': 0.0,
+            'bullet_point_count': 0,
+            'penalties': [],
+            'bonuses': []
+        }),
+        (0.0, {
+            'action_verb_count': 0,
+            'verbs_found': [],
+            'benchmark': ACTION_VERB_BENCHMARK
+        }),
+        (0.0, {
+            'similarity_score': 0.0,
+            'method': SIMILARITY_METHOD,
+            'interpretation': '0.0% semantic overlap'
+        }),
+    ]
+
+
+def _component_scores(resume_text: str, resume_processed: str, jd: JDContext,
+                      similarity: Optional[float] = None) -> List[Tuple[float, Dict]]:
+    """(score, details) of each ATS component, in calculate_ats_score() order."""
+    # Tokenize the resume once for the keyword and action verb scorers
+    resume_words = resume_processed.split()
+    return [
+        score_keyword_matching(resume_text, jd.text, resume_processed, jd.processed, jd.keywords, resume_words),
+        score_resume_sections(resume_text),
+        score_formatting_heuristics(resume_text),
+        score_action_verbs(resume_text, resume_processed, resume_words),
+        score_semantic_similarity(resume_text, jd.text, resume_processed, jd.processed, similarity),
+    ]
+
+
+def _ats_result(components: List[Tuple[float, Dict]], unscored_reason: Optional[str] = None) -> Dict:
+    """
+    Combine the component (score, details) pairs into the final ATS result.
     
-    Args:
-        resume_text: Resume text
-        jd_text: Job Description text
-        
-    Returns:
-        Dictionary with final score and detailed breakdown
+    With unscored_reason the result is flagged 'unscored' and carries the
+    reason instead of a meaningful breakdown.
     """
-    # Calculate individual component scores
-    keyword_score, keyword_details = score_keyword_matching(resume_text, jd_text)
-    section_score, section_details = score_resume_sections(resume_text)
-    formatting_score, formatting_details = score_formatting_heuristics(resume_text)
-    action_verb_score, action_verb_details = score_action_verbs(resume_text)
-    semantic_score, semantic_details = score_semantic_similarity(resume_text, jd_text)
+    (
+        (keyword_score, keyword_details),
+        (section_score, section_details),
+        (formatting_score, formatting_details),
+        (action_verb_score, action_verb_details),
+        (semantic_score, semantic_details),
+    ) = components
     
     # Calculate final score
     final_score = (
@@ -374,8 +643,9 @@ def calculate_ats_score(resume_text: str, jd_text: str) -> Dict:
     # Clamp between 0 and 100
     final_score = max(0, min(100, final_score))
     
-    return {
+    result = {
         'final_score': round(final_score, 2),
+        'unscored': unscored_reason is not None,
         'components': {
             'keyword_matching': {
                 'score': round(keyword_score, 2),
@@ -404,6 +674,96 @@ def calculate_ats_score(resume_text: str, jd_text: str) -> Dict:
             }
         }
     }
+    if unscored_reason is not None:
+        result['unscored_reason'] = unscored_reason
+    return result
+
+
+def _unscored_reason(resume_word_count: int, jd_word_count: int) -> str:
+    """Explain why a resume/JD pair is too short to score."""
+    return (
+        f'Too little text to score: the resume has {resume_word_count} words '
+        f'(minimum {MIN_RESUME_WORDS}) and the job description has {jd_word_count} '
+        f'words (minimum {MIN_JD_WORDS}).'
+    )
+
+
+def calculate_ats_score(resume_text: str, jd_text: Union[str, JDContext]) -> Dict:
+    """
+    Calculate comprehensive ATS score (0-100) with breakdown by component.
+    
+    Components:
+    - Keyword Matching (40%)
+    - Resume Section Detection (20%)
+    - Formatting Heuristics (10%)
+    - Action Verbs & Impact Language (10%)
+    - Semantic Similarity (10%)
+    
+    Args:
+        resume_text: Resume text
+        jd_text: Job Description text, or a JDContext built from it
+        
+    Returns:
+        Dictionary with final score and detailed breakdown. Resumes under
+        MIN_RESUME_WORDS words or JDs under MIN_JD_WORDS words are not
+        scored: the result has 'unscored' set, a final score of 0 and an
+        'unscored_reason' message.
+    """
+    resume_word_count = len(resume_text.split())
+    jd_word_count = len((jd_text.text if isinstance(jd_text, JDContext) else jd_text).split())
+    
+    if resume_word_count < MIN_RESUME_WORDS or jd_word_count < MIN_JD_WORDS:
+        return _ats_result(
+            _unscorable_components(resume_word_count),
+            _unscored_reason(resume_word_count, jd_word_count)
+        )
+    
+    jd = jd_text if isinstance(jd_text, JDContext) else JDContext(jd_text)
+    
+    # Preprocess the resume once and share it across the component scorers
+    return _ats_result(_component_scores(resume_text, preprocess_text(resume_text), jd))
+
+
+def calculate_ats_scores_batch(resume_texts: List[str], jd_text: Union[str, JDContext]) -> List[Dict]:
+    """
+    Calculate the ATS score of many resumes against one job description.
+    
+    Gives the same results as calling calculate_ats_score() for each
+    resume, but the JD is preprocessed and analyzed once, and the semantic
+    similarities are derived from term counts instead of fitting a TF-IDF
+    vectorizer per resume.
+    
+    Args:
+        resume_texts: Resume texts
+        jd_text: Job Description text, or a JDContext built from it
+        
+    Returns:
+        List of calculate_ats_score() results, in the order of resume_texts
+    """
+    jd = jd_text if isinstance(jd_text, JDContext) else JDContext(jd_text)
+    jd_word_count = len(jd.text.split())
+    resume_word_counts = [len(resume_text.split()) for resume_text in resume_texts]
+    
+    # Preprocess and compare only the resumes that are long enough to score
+    scorable = [
+        i for i, resume_word_count in enumerate(resume_word_counts)
+        if resume_word_count >= MIN_RESUME_WORDS and jd_word_count >= MIN_JD_WORDS
+    ]
+    resumes_processed = {i: preprocess_text(resume_texts[i]) for i in scorable}
+    similarities = dict(zip(scorable, _tfidf_similarities(list(resumes_processed.values()), jd.processed)))
+    
+    results = []
+    for i, resume_text in enumerate(resume_texts):
+        if i in resumes_processed:
+            results.append(_ats_result(
+                _component_scores(resume_text, resumes_processed[i], jd, similarities[i])
+            ))
+        else:
+            results.append(_ats_result(
+                _unscorable_components(resume_word_counts[i]),
+                _unscored_reason(resume_word_counts[i], jd_word_count)
+            ))
+    return results
 
 
 # ==================== IMPROVEMENT SUGGESTIONS ====================
@@ -419,6 +779,9 @@ def generate_improvement_suggestions(ats_result: Dict, threshold: float = 75.0)
     Returns:
         List of improvement suggestions
     """
+    if ats_result.get('unscored'):
+        return [f"📝 {ats_result['unscored_reason']}"]
+    
     suggestions = []
     components = ats_result['components']
     
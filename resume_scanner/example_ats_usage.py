@@ -8,7 +8,7 @@ Run this file to test the ATS scorer without the Streamlit UI:
     python example_ats_usage.py
 """
 
-from ats_scorer import calculate_ats_score, generate_improvement_suggestions
+from ats_scorer import JDContext, calculate_ats_score, calculate_ats_scores_batch, generate_improvement_suggestions
 import json
 
 
@@ -201,6 +201,10 @@ def print_ats_result(name: str, ats_result: dict):
     
     print(f"\nFinal ATS Score: {score}/100 [{status}]")
     
+    if ats_result['unscored']:
+        print(f"Not scored: {ats_result['unscored_reason']}")
+        return
+    
     # Component Breakdown
     print("\n" + "-" * 80)
     print("SCORE BREAKDOWN")
@@ -302,6 +306,27 @@ def test_case_4():
     print_ats_result("Minimal Resume vs Minimal JD", ats_result)
 
 
+def test_case_5():
+    """Test: Rank several resumes against one JD"""
+    print("\n" + "╔" + "=" * 78 + "╗")
+    print("║" + " TEST CASE 5: RANKING - All Resumes vs Python Developer JD ".center(78) + "║")
+    print("╚" + "=" * 78 + "╝")
+    
+    # Prepare the JD once and reuse it for every resume
+    jd = JDContext(SAMPLE_JD_1)
+    resumes = {
+        'Senior Python Developer': SAMPLE_RESUME_1,
+        'Generic Resume': SAMPLE_RESUME_2,
+        'Data Analyst': SAMPLE_RESUME_3,
+    }
+    results = calculate_ats_scores_batch(list(resumes.values()), jd)
+    scores = {name: result['final_score'] for name, result in zip(resumes, results)}
+    
+    print()
+    for rank, (name, score) in enumerate(sorted(scores.items(), key=lambda item: -item[1]), 1):
+        print(f"{rank}. {name:.<40} {score:>6} / 100")
+
+
 # ==================== MAIN ====================
 
 if __name__ == '__main__':
@@ -315,6 +340,7 @@ if __name__ == '__main__':
     test_case_2()
     test_case_3()
     test_case_4()
+    test_case_5()
     
     # Summary
     print("\n" + "=" * 80)